@@ -0,0 +1,70 @@
+# Persistent per-host cache of site-structure facts (guessed content
+# selectors and the discovered WP API root).
+#
+# Deriving these costs extra HTTP round-trips and parsing, yet the answers
+# are stable per site, so they are kept on disk and reused across runs
+# until they go stale.
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')),
+    'blech', 'selectors.json')
+# Selectors older than this are re-guessed (themes do change occasionally)
+_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+
+def _load_entry(host: str, field: str):
+    """Returns a cached field for a host, or None if absent/stale."""
+    try:
+        with open(_CACHE_PATH, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    entry = cache.get(host)
+    if not entry or time.time() - entry.get('saved_at', 0) > _MAX_AGE_SECONDS:
+        return None
+    return entry.get(field)
+
+
+def _store_entry(host: str, field: str, value) -> None:
+    """Records a field for a host; failures only log, never raise."""
+    try:
+        try:
+            with open(_CACHE_PATH, encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        entry = cache.setdefault(host, {})
+        entry[field] = value
+        entry['saved_at'] = time.time()
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not persist site cache: {e}")
+
+
+def load_selectors(host: str) -> Optional[Dict[str, Optional[str]]]:
+    """Returns the cached selectors for a host, or None if absent/stale."""
+    return _load_entry(host, 'selectors')
+
+
+def store_selectors(host: str, selectors: Dict[str, Optional[str]]) -> None:
+    """Records a host's guessed selectors."""
+    _store_entry(host, 'selectors', selectors)
+
+
+def load_api_root(host: str) -> Optional[str]:
+    """Returns the cached WP API root for a host, or None if absent/stale."""
+    return _load_entry(host, 'api_root')
+
+
+def store_api_root(host: str, api_root: str) -> None:
+    """Records a host's discovered WP API root."""
+    _store_entry(host, 'api_root', api_root)
@@ -0,0 +1,25 @@
+# Memoized URL parsing helpers shared across the package.
+#
+# The scraper parses and joins the same URLs repeatedly (dedup checks,
+# relative-link resolution, pattern analysis), so caching the C-level
+# parse work avoids redundant string processing and object allocation.
+from functools import lru_cache
+from urllib.parse import SplitResult, urljoin, urlsplit
+
+
+@lru_cache(maxsize=4096)
+def cached_urlsplit(url: str) -> SplitResult:
+    """Like urllib.parse.urlsplit, but memoized."""
+    return urlsplit(url)
+
+
+@lru_cache(maxsize=4096)
+def cached_urljoin(base: str, url: str) -> str:
+    """Like urllib.parse.urljoin, but memoized."""
+    return urljoin(base, url)
+
+
+def clear_url_caches() -> None:
+    """Releases memory held by the URL caches (e.g., at the end of a run)."""
+    cached_urlsplit.cache_clear()
+    cached_urljoin.cache_clear()
@@ -0,0 +1,3 @@
+# Package version as a plain attribute so startup avoids an
+# importlib.metadata scan. Keep in sync with pyproject.toml.
+__version__ = "0.3.0"
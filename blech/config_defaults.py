@@ -3,6 +3,7 @@
 # --- Request Settings ---
 REQUEST_TIMEOUT = 15  # seconds
 INTER_REQUEST_DELAY = 1.0 # seconds - Be polite to servers!
+MAX_CONCURRENT_REQUESTS = 8  # Worker threads used when fetching post pages concurrently
 DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; BLECH-Scraper/0.1; +https://github.com/your_username/blech)" # Update with your repo URL
 
 # --- URL Filtering ---
@@ -61,6 +62,29 @@ COMMON_DATE_SELECTORS = [
     '.meta-date',
     '.posted-on' # Common WP theme class
 ]
+# Known platforms whose selectors are stable enough to skip the guessing
+# probe entirely. Keys are hostname suffixes matched against the sample
+# URL's domain (ignoring a leading www.).
+KNOWN_HOST_SELECTORS = {
+    'wordpress.com': {
+        'title': 'h1.entry-title',
+        'date': 'time.entry-date',
+        'date_attr': 'datetime',
+        'content': 'div.entry-content',
+    },
+    'ghost.io': {
+        'title': 'h1.article-title',
+        'date': 'time.byline-meta-date',
+        'date_attr': 'datetime',
+        'content': 'section.gh-content',
+    },
+    'medium.com': {
+        'title': 'h1',
+        'date': 'article time',
+        'date_attr': 'datetime',
+        'content': 'article section',
+    },
+}
 # Fallback regex patterns for dates if selectors fail (use with caution)
 DATE_REGEX_PATTERNS = [
     # ISO-like YYYY-MM-DD
@@ -1,13 +1,7 @@
-import argparse
-import importlib.metadata  # To read version from pyproject.toml
 import logging
 import os
 import re
 import sys
-from typing import List
-from urllib.parse import urlparse
-
-import requests
 
 # Import config_defaults for default values
 try:
@@ -17,66 +11,214 @@ except ImportError:
     # When running the file directly
     from blech import config_defaults as config
 
-try:
-    __version__ = importlib.metadata.version("blech")
-except importlib.metadata.PackageNotFoundError:
-    # Handle case where package is not installed (e.g., running from source)
-    __version__ = "0.0.0-dev"
+_version: "str | None" = None
+
+def _get_version() -> str:
+    """Looks up the package version lazily, caching the result.
+
+    Prefers the static blech/_version.py attribute (a single import, no
+    metadata scan); falls back to importlib.metadata only if that file is
+    missing, and only when --version was actually requested.
+    """
+    global _version
+    if _version is None:
+        try:
+            try:
+                from ._version import __version__ as _version
+            except ImportError:
+                from blech._version import __version__ as _version
+        except ImportError:
+            import importlib.metadata
+            try:
+                _version = importlib.metadata.version("blech")
+            except importlib.metadata.PackageNotFoundError:
+                # Handle case where package is not installed (e.g., running from source)
+                _version = "0.0.0-dev"
+    return _version
+
+
+_PROG = "blech"
+
+_USAGE = """\
+usage: blech [-h] [-vsn] [-o OUTPUT] [-l LANG] [--one-file]
+             [--refresh-selectors] [-v] [--max-pages MAX_PAGES]
+             [--start-page START_PAGE] [--end-page END_PAGE]
+             [--posts-per-page POSTS_PER_PAGE]
+             base_url
+
+Scrape blog posts. Tries WP REST API first, then falls back to HTML scraping heuristics.
+
+positional arguments:
+  base_url              The base URL of the blog listing page (e.g., 'https://example.com/blog').
+
+options:
+  -h, --help            show this help message and exit
+  -vsn, --version       show program's version number and exit
+  -o, --output OUTPUT   Output filename (.txt). If not provided, generates based on domain.
+  -l, --lang LANG       Optional language code filter (e.g., 'en', 'fi'). Primarily affects API requests.
+  --one-file            Save all blog posts to a single file instead of separate files.
+  --refresh-selectors   Ignore cached content selectors and re-guess them.
+  -v, --verbose         Enable debug logging.
+  --max-pages MAX_PAGES
+                        Maximum number of pages to fetch. (default: {max_pages})
+  --start-page START_PAGE
+                        Starting page number for scraping. (default: 1)
+  --end-page END_PAGE   Ending page number for scraping.
+  --posts-per-page POSTS_PER_PAGE
+                        Number of posts to fetch per API request. (default: {posts_per_page})
+"""
+
+
+def _cli_error(message: str) -> "None":
+    """Prints a usage error like argparse would and exits with status 2."""
+    print(f"usage: {_PROG} [-h] [options] base_url", file=sys.stderr)
+    print(f"{_PROG}: error: {message}", file=sys.stderr)
+    sys.exit(2)
+
+
+def _parse_args(argv):
+    """Minimal hand-rolled argument parser for the blech CLI.
+
+    argparse pulls in gettext/textwrap and builds a full parser object on
+    every cold start; this CLI is small and stable enough that a single
+    pass over argv is cheaper. Accepts the same invocations as argparse
+    for this option set (including '--flag=value' and attached '-ovalue'
+    forms), except that long-option prefix abbreviation (e.g. '--out' for
+    '--output') is deliberately not supported.
+    """
+    import types
+
+    args = types.SimpleNamespace(
+        base_url=None,
+        output=None,
+        lang=None,
+        one_file=False,
+        refresh_selectors=False,
+        verbose=False,
+        max_pages=config.API_MAX_PAGES,
+        start_page=1,
+        end_page=None,
+        posts_per_page=config.API_POSTS_PER_PAGE,
+    )
+
+    value_flags = {
+        '-o': 'output', '--output': 'output',
+        '-l': 'lang', '--lang': 'lang',
+        '--max-pages': 'max_pages',
+        '--start-page': 'start_page',
+        '--end-page': 'end_page',
+        '--posts-per-page': 'posts_per_page',
+    }
+    int_dests = {'max_pages', 'start_page', 'end_page', 'posts_per_page'}
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in ('-h', '--help'):
+            print(_USAGE.format(max_pages=config.API_MAX_PAGES, posts_per_page=config.API_POSTS_PER_PAGE))
+            sys.exit(0)
+        elif token in ('-vsn', '--version'):
+            print(f"{_PROG} {_get_version()}")
+            sys.exit(0)
+        elif token == '--one-file':
+            args.one_file = True
+        elif token == '--refresh-selectors':
+            args.refresh_selectors = True
+        elif token in ('-v', '--verbose'):
+            args.verbose = True
+        else:
+            flag, _, inline_value = token.partition('=')
+            if flag not in value_flags and len(token) > 2 and not token.startswith('--') \
+                    and token[:2] in value_flags:
+                # Attached short-option value, e.g. -ofoo.txt
+                flag, inline_value = token[:2], token[2:]
+            if flag in value_flags:
+                if inline_value:
+                    value = inline_value
+                else:
+                    i += 1
+                    if i >= len(argv):
+                        _cli_error(f"argument {flag}: expected one argument")
+                    value = argv[i]
+                dest = value_flags[flag]
+                if dest in int_dests:
+                    try:
+                        value = int(value)
+                    except ValueError:
+                        _cli_error(f"argument {flag}: invalid int value: '{value}'")
+                setattr(args, dest, value)
+            elif token.startswith('-') and token != '-':
+                _cli_error(f"unrecognized arguments: {token}")
+            elif args.base_url is None:
+                args.base_url = token
+            else:
+                _cli_error(f"unrecognized arguments: {token}")
+        i += 1
+
+    if args.base_url is None:
+        _cli_error("the following arguments are required: base_url")
+
+    return args
 
 # Import from local modules within the package
 try:
     # When running as an installed package
-    from .models import PostData
-    from .scraper import BlogScraper
+    from ._urlcache import cached_urlsplit, clear_url_caches
 except ImportError:
     # When running the file directly
-    from blech.models import PostData
-    from blech.scraper import BlogScraper
+    from blech._urlcache import cached_urlsplit, clear_url_caches
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Precompiled at module scope so call sites skip the re-cache lookup
+_DOMAIN_SANITIZE_RE = re.compile(r'[^\w\-.]+')
+
 # Define the main function that will be called by the entry point
 def main():
-    parser = argparse.ArgumentParser(
-        description="Scrape blog posts. Tries WP REST API first, then falls back to HTML scraping heuristics.",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    parser.add_argument("base_url", help="The base URL of the blog listing page (e.g., 'https://example.com/blog').")
-    parser.add_argument(
-        "-vsn", "--version", action="version", version=f"%(prog)s {__version__}"
-    )
-    parser.add_argument("-o", "--output", help="Output filename (.txt). If not provided, generates based on domain.", default=None)
-    parser.add_argument("-l", "--lang", help="Optional language code filter (e.g., 'en', 'fi'). Primarily affects API requests.", default=None)
-    parser.add_argument("--one-file", help="Save all blog posts to a single file instead of separate files.", action="store_true")
-    parser.add_argument("-v", "--verbose", help="Enable debug logging.", action="store_true")
-    parser.add_argument("--max-pages", type=int, help="Maximum number of pages to fetch.", default=config.API_MAX_PAGES)
-    parser.add_argument("--start-page", type=int, help="Starting page number for scraping.", default=1)
-    parser.add_argument("--end-page", type=int, help="Ending page number for scraping.", default=None)
-    parser.add_argument("--posts-per-page", type=int, help="Number of posts to fetch per API request.", default=config.API_POSTS_PER_PAGE)
+    args = _parse_args(sys.argv[1:])
 
-    args = parser.parse_args()
+    # Defer the heavy imports (requests, bs4 via scraper) until we know a
+    # scrape is actually happening; --help/--version exit before this point.
+    import requests
+    try:
+        # When running as an installed package
+        from .scraper import BlogScraper
+    except ImportError:
+        # When running the file directly
+        from blech.scraper import BlogScraper
 
     if args.verbose:
-        # Get the root logger and set level to DEBUG
+        # basicConfig handlers default to NOTSET and inherit the root level,
+        # so raising the root logger is sufficient.
         logging.getLogger().setLevel(logging.DEBUG)
-        # Also need to adjust handler level if using basicConfig defaults
-        for handler in logging.getLogger().handlers:
-             handler.setLevel(logging.DEBUG)
         logging.debug("Debug logging enabled.")
 
-    # Generate default filename if needed
+    # Generate default filename if needed. urlsplit does not raise on
+    # malformed input (it just returns an empty netloc), so check that
+    # explicitly instead of wrapping the parse in a dead try/except.
     output_filename = args.output
     if not output_filename:
-        try:
-            domain = urlparse(args.base_url).netloc.replace('www.', '')
-            # Sanitize domain for filename more robustly
-            safe_domain = re.sub(r'[^\w\-.]+', '_', domain).strip('_')
-            output_filename = f"{safe_domain}_blog_posts{'.txt' if args.one_file else ''}" if safe_domain else "blog_posts_output.txt"
-        except Exception as e:
-            logging.warning(f"Could not parse domain from base_url: {e}. Using default filename.")
-            output_filename = f"blog_posts_output.txt"
+        # Mirror the scraper's normalization: assume https:// if no scheme given
+        base_for_name = args.base_url if args.base_url.startswith(('http://', 'https://')) else 'https://' + args.base_url
+        split_url = cached_urlsplit(base_for_name)
+        if not split_url.netloc:
+            logging.error(f"Invalid base_url: {args.base_url}. Could not determine a domain.")
+            sys.exit(2)
+        domain = split_url.netloc.replace('www.', '')
+        # Sanitize domain for filename more robustly. Typical hostnames are
+        # already safe, so a cheap C-level scan skips the regex entirely.
+        if domain.isascii() and all(c.isalnum() or c in '-.' for c in domain):
+            safe_domain = domain.strip('_')
+        else:
+            safe_domain = _DOMAIN_SANITIZE_RE.sub('_', domain).strip('_')
+        output_filename = f"{safe_domain}_blog_posts{'.txt' if args.one_file else ''}" if safe_domain else "blog_posts_output.txt"
         logging.info(f"Output filename not specified, using default: {output_filename}")
 
+    # Intern the language code: the scraper compares it repeatedly, and
+    # interned strings reduce those comparisons to pointer checks.
+    if args.lang:
+        args.lang = sys.intern(args.lang)
+
     try:
         # Create scraper with output_filename parameter and pagination parameters
         scraper = BlogScraper(
@@ -90,13 +232,17 @@ def main():
         )
         # Set one_file flag based on command-line argument
         scraper.one_file = args.one_file
+        scraper.refresh_selectors = args.refresh_selectors
 
         logging.info("Starting scraping process...")
-        all_posts_data: List[PostData] = scraper.run()
-        logging.info(f"Scraping finished. Found {len(all_posts_data)} posts.")
+        # Stream posts as they are extracted; the scraper writes each one to
+        # disk immediately, so there is no need to hold the full list in memory.
+        post_count = 0
+        for _ in scraper.iter_posts():
+            post_count += 1
+        logging.info(f"Scraping finished. Found {post_count} posts.")
 
-        # Posts are now saved immediately after processing, so we don't need to save them again here
-        if all_posts_data:
+        if post_count:
             if args.one_file:
                 logging.info(f"All posts have been saved to {output_filename}.")
             else:
@@ -104,6 +250,9 @@ def main():
         else:
             logging.warning("No posts were successfully extracted.")
 
+        # Release memory held by the memoized URL parses
+        clear_url_caches()
+
     except ValueError as ve: # Specific configuration/setup errors
         logging.error(f"Configuration error: {ve}")
         sys.exit(1) # Exit with error code
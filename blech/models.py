@@ -14,4 +14,12 @@ class PostData:
         title_str = self.title if self.title else "No Title Found"
         date_str = f"Date: {self.date}" if self.date else "Date: Not Found"
         content_str = self.content if self.content else "Content: Not Found"
-        return f"# {title_str}\nURL: {self.url}\n{date_str}\n\n{content_str}\n\n{'='*80}\n\n" 
+        return f"# {title_str}\nURL: {self.url}\n{date_str}\n\n{content_str}\n\n{'='*80}\n\n"
+
+    def format_output_bytes(self) -> bytes:
+        """UTF-8 encoded form of format_output, cached after the first call."""
+        cached = self.__dict__.get('_encoded_output')
+        if cached is None:
+            cached = self.format_output().encode('utf-8')
+            self.__dict__['_encoded_output'] = cached
+        return cached 
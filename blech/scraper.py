@@ -1,25 +1,151 @@
 import logging
 import re
+import sys
 import time
 import hashlib
 import os
-from typing import Any, Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse, parse_qs
+import threading
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from functools import lru_cache
+
+# Prefer the lxml C parser when installed (the 'fast' extra); it parses
+# realistic blog HTML several times faster than the pure-Python fallback.
+try:
+    import lxml  # noqa: F401
+    from lxml import etree as _lxml_etree
+    SOUP_PARSER = 'lxml'
+except ImportError:
+    _lxml_etree = None
+    SOUP_PARSER = 'html.parser'
+
+# Only advertise brotli when a decoder is installed (the 'fast' extra);
+# requests cannot transparently decode 'br' without one.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# orjson (the 'fast' extra) decodes the large WP API payloads several times
+# faster than the stdlib decoder.
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    import json as _json
+
+    def _json_loads(data: bytes) -> Any:
+        return _json.loads(data)
 
 try:
     # When running as an installed package
     from . import config_defaults as config
+    from ._selectorcache import (load_api_root, load_selectors,
+                                 store_api_root, store_selectors)
+    from ._urlcache import cached_urljoin, cached_urlsplit
     from .models import PostData
 except ImportError:
     # When running the file directly
     from blech import config_defaults as config
+    from blech._selectorcache import (load_api_root, load_selectors,
+                                      store_api_root, store_selectors)
+    from blech._urlcache import cached_urljoin, cached_urlsplit
     from blech.models import PostData
 
 logger = logging.getLogger(__name__)
 
+# Flush threshold for the manually buffered single-file output path
+_WRITE_BUF_THRESHOLD = 1 << 20
+# Anything larger than this is not a blog post worth parsing
+_MAX_HTML_BYTES = 5 << 20
+
+
+# Discovery pages are only mined for links, so parsing can be restricted to
+# anchors plus the navigation containers that get decomposed; the WP API probe
+# needs just one <link> element.
+LINK_STRAINER = SoupStrainer(['a', 'nav', 'header', 'footer'])
+
+
+class _StreamLinkCollector:
+    """lxml target parser that harvests candidate article links.
+
+    Mirrors _collect_article_links' heuristics while the response body is
+    still streaming in: anchors inside nav/header/footer are ignored, and a
+    link qualifies with >=5 characters of stripped text or an image carrying
+    alt text. The full body and DOM are never materialized.
+    """
+
+    def __init__(self):
+        self._nav_depth = 0
+        self._open_anchors = []  # stack of [href, text_len, has_img_alt]
+        self.links: List[str] = []
+
+    def start(self, tag, attrs):
+        if tag in ('nav', 'header', 'footer'):
+            self._nav_depth += 1
+        elif self._nav_depth == 0:
+            if tag == 'a' and attrs.get('href'):
+                self._open_anchors.append([attrs['href'], 0, False])
+            elif tag == 'img' and attrs.get('alt') and self._open_anchors:
+                self._open_anchors[-1][2] = True
+
+    def end(self, tag):
+        if tag in ('nav', 'header', 'footer'):
+            self._nav_depth = max(0, self._nav_depth - 1)
+        elif tag == 'a' and self._nav_depth == 0 and self._open_anchors:
+            href, text_len, has_img_alt = self._open_anchors.pop()
+            if text_len >= 5 or has_img_alt:
+                self.links.append(href)
+
+    def data(self, data):
+        if self._open_anchors and self._nav_depth == 0:
+            self._open_anchors[-1][1] += len(data.strip())
+
+    def comment(self, text):
+        pass
+
+    def close(self) -> List[str]:
+        return self.links
+
+
+WP_API_LINK_STRAINER = SoupStrainer('link', rel='https://api.w.org/')
+
+
+@lru_cache(maxsize=256)
+def _compiled_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compiles a CSS selector once; soup.select_one re-parses it per call."""
+    return soupsieve.compile(selector)
+
+# Regexes used in per-post hot paths, compiled once at import
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-.]+')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_PAGE_PARAM_RE = re.compile(r'[?&]page=(\d+)')
+# Byte-level probe for the WP API <link> tag; either attribute order. A raw
+# scan of the body is far cheaper than building even a strained soup.
+_WP_API_LINK_RES = [
+    re.compile(rb'<link[^>]+rel=["\']https://api\.w\.org/["\'][^>]*href=["\']([^"\']+)["\']'),
+    re.compile(rb'<link[^>]+href=["\']([^"\']+)["\'][^>]*rel=["\']https://api\.w\.org/["\']'),
+]
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+# One alternation finds the first date of any supported format in a single
+# scan of the content: DD.MM.YYYY, YYYY-MM-DD, MM/DD/YYYY (or DD/MM/YYYY)
+# and DD Month YYYY.
+_CONTENT_DATE_RE = re.compile(
+    r'(\d{1,2}\.\d{1,2}\.\d{4}'
+    r'|\d{4}-\d{1,2}-\d{1,2}'
+    r'|\d{1,2}/\d{1,2}/\d{4}'
+    r'|\d{1,2}\s+[A-Za-z]+\s+\d{4})')
+
 class BlogScraper:
     def __init__(self, base_url: str, lang: Optional[str] = None, output_filename: Optional[str] = None,
                  max_pages: Optional[int] = None, start_page: int = 1, end_page: Optional[int] = None,
@@ -43,6 +169,11 @@ class BlogScraper:
         self.lang = lang
         self.output_filename = output_filename
         self.one_file = False  # Default to saving as separate files
+        self.refresh_selectors = False  # Skip the on-disk selector cache when True
+        self._one_file_fd: Optional[int] = None  # Lazily opened raw fd for single-file output
+        self._one_file_tmp: Optional[str] = None  # Temp path the fd writes to, os.replace'd on success
+        self._one_file_buf = bytearray()  # Pending encoded output, flushed at _WRITE_BUF_THRESHOLD
+        self._write_executor: Optional[ThreadPoolExecutor] = None  # Single writer thread for file output
 
         # Pagination control
         self.max_pages = max_pages if max_pages is not None else config.API_MAX_PAGES
@@ -51,33 +182,71 @@ class BlogScraper:
         self.posts_per_page = posts_per_page if posts_per_page is not None else config.API_POSTS_PER_PAGE
 
         # Internal state
+        self._html_cache: Dict[str, Tuple[bytes, str]] = {}  # One-shot body reuse (e.g., API discovery -> HTML scrape)
         self.discovered_urls: Set[str] = set()
         self.processed_urls: Set[str] = set()
         self.all_post_data: List[PostData] = []
+        self._saved_post_count: int = 0
         self.likely_post_url_pattern: Optional[str] = None
         self.filtered_urls: Set[str] = set()  # URLs that match the likely post pattern
         self.api_post_data: Dict[str, Dict[str, Any]] = {}  # Store API data for each post URL
 
         # Pagination state for special cases
-        self._afry_pagination_template: Optional[str] = None
-        self._afry_highest_page: int = 0
-        self._afry_consecutive_empty_pages: int = 0
-        self._afry_page_content_hashes: Dict[int, int] = {}  # Store content hash for each page
-        self._afry_consecutive_duplicate_pages: int = 0
-
-        # Configuration from defaults
+        # Cached "{base}?page={}" template built on the first pagination call
+        self._pagination_template: Optional[str] = None
+        # Fingerprints of discovery-page bodies already seen: blake2b is
+        # stable across runs (unlike hash()) and lets pagination that serves
+        # the same body under different URLs be skipped without re-mining it.
+        self._seen_page_digests: Set[bytes] = set()
+
+        # Shared politeness pacer: concurrent fetch workers take request
+        # slots spaced INTER_REQUEST_DELAY apart from one schedule, so the
+        # aggregate request rate matches a serial loop sleeping between
+        # requests no matter how many workers are fetching.
+        self._pace_lock = threading.Lock()
+        self._next_request_at = 0.0
+
+        # Configuration from defaults. Mount an adapter with a pool large
+        # enough for the concurrent fetch workers (keep-alive avoids a TLS
+        # handshake per request) and bounded retries for transient errors.
         self.session = requests.Session()
-        self.session.headers.update({'User-Agent': config.DEFAULT_USER_AGENT})
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': config.DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+        })
 
         # Parse base URL details
-        parsed_uri = urlparse(self.base_url)
-        self.base_scheme = parsed_uri.scheme
-        self.base_domain = parsed_uri.netloc
+        parsed_uri = cached_urlsplit(self.base_url)
+        # Intern the scheme and domain: both are compared against every
+        # discovered URL, and interning makes equality a pointer check.
+        self.base_scheme = sys.intern(parsed_uri.scheme)
+        self.base_domain = sys.intern(parsed_uri.netloc)
         # Try to determine a sensible root path for relative link resolution
         self.potential_blog_root = parsed_uri.path if parsed_uri.path.endswith('/') else parsed_uri.path + '/'
         if not self.potential_blog_root.startswith('/'):
             self.potential_blog_root = '/' + self.potential_blog_root
 
+        # Derived values _is_likely_post_url needs on every call; computing
+        # them once here keeps the per-link work to plain comparisons.
+        self._base_domain_no_www = self.base_domain.removeprefix('www.')
+        self._root_len = len(self.potential_blog_root)
+        self._root_is_slash = self.potential_blog_root == '/'
+
+        # Precompiled URL-filter predicates (see _is_likely_post_url): one
+        # regex alternation for path segments, a tuple for the C-level
+        # endswith, and a frozenset for O(1) query-param membership.
+        self._nonpost_path_re = re.compile('|'.join(re.escape(s) for s in config.NON_POST_PATH_SEGMENTS))
+        self._nonpost_ext_tuple = tuple(e.lower() for e in config.NON_POST_FILE_EXTENSIONS)
+        self._nonpost_query_set = frozenset(config.NON_POST_QUERY_PARAMS)
+
         # API detection state
         self.api_root_url: Optional[str] = None
         self._api_used_successfully: bool = False
@@ -95,7 +264,7 @@ class BlogScraper:
         """Validates and normalizes a URL."""
         if not url.startswith(('http://', 'https://')):
             url = 'https://' + url # Assume https if no scheme
-        parsed = urlparse(url)
+        parsed = cached_urlsplit(url)
         if not parsed.scheme or not parsed.netloc:
             raise ValueError(f"Invalid base_url: {url}. Could not parse scheme or domain.")
         return url
@@ -112,9 +281,19 @@ class BlogScraper:
             return  # Skip saving if no output filename was provided
 
         if self.one_file:
-            # Append to a single file
-            with open(self.output_filename, 'a', encoding='utf-8') as f:
-                f.write(post_data.format_output())
+            # Append through a raw fd with manual buffering: encode once and
+            # batch into ~1 MiB os.write calls, skipping the TextIOWrapper and
+            # BufferedWriter layers entirely.
+            # Write to a temp file and os.replace it into place on success:
+            # the kernel can batch flushes on close, and a crash leaves any
+            # previous output file intact.
+            if self._one_file_fd is None:
+                self._one_file_tmp = self.output_filename + '.tmp'
+                self._one_file_fd = os.open(self._one_file_tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            self._one_file_buf += post_data.format_output_bytes()
+            if len(self._one_file_buf) >= _WRITE_BUF_THRESHOLD:
+                os.write(self._one_file_fd, self._one_file_buf)
+                self._one_file_buf.clear()
             logger.info(f"Appended post to {self.output_filename}")
         else:
             # Create directory for separate files if it doesn't exist
@@ -126,120 +305,331 @@ class BlogScraper:
             # Create a safe filename from the post title or use index if title is not available
             if post_data.title:
                 # Sanitize title for filename
-                safe_title = re.sub(r'[^\w\-.]+', '_', post_data.title).strip('_')
+                safe_title = _FILENAME_SANITIZE_RE.sub('_', post_data.title).strip('_')
                 # Limit filename length and ensure uniqueness with index
                 safe_title = safe_title[:50] + f"_{index+1}"
             else:
                 safe_title = f"post_{index+1}"
 
             file_path = os.path.join(dir_name, f"{safe_title}.txt")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(post_data.format_output())
+            with open(file_path, 'wb') as f:
+                f.write(post_data.format_output_bytes())
             logger.info(f"Saved post to {file_path}")
 
-    def _fetch_soup(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetches content from a URL and returns a BeautifulSoup object."""
+    def _pace(self, delay: float) -> None:
+        """Blocks until the next slot in the shared politeness schedule.
+
+        Slots are handed out ``delay`` seconds apart across all worker
+        threads, so N concurrent workers still produce the aggregate request
+        rate of a serial loop sleeping ``delay`` between requests.
+        """
+        if delay <= 0:
+            return
+        with self._pace_lock:
+            now = time.monotonic()
+            slot = max(self._next_request_at, now)
+            self._next_request_at = slot + delay
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _fetch_html(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Fetches a URL, returning its raw body and detected encoding.
+
+        Streams the response so non-HTML bodies (PDFs, media files that
+        slipped past the URL filter) are rejected from the headers alone, and
+        caps the bytes read at _MAX_HTML_BYTES so a pathological page cannot
+        balloon memory or parse time.
+        """
+        cached = self._html_cache.pop(url, None)
+        if cached is not None:
+            logger.debug(f"Reusing cached body for {url}")
+            return cached
         try:
-            response = self.session.get(url, timeout=config.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            # Try to detect encoding, fallback to utf-8
-            encoding = response.encoding if response.encoding else 'utf-8'
-            # Use response.content and decode manually for better encoding handling
-            soup = BeautifulSoup(response.content, 'html.parser', from_encoding=encoding)
-            return soup
+            with self.session.get(url, timeout=config.REQUEST_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and not content_type.startswith(('text/html', 'application/xhtml')):
+                    logger.warning(f"Skipping non-HTML content at {url} ({content_type})")
+                    return None
+                # Try to detect encoding, fallback to utf-8
+                encoding = response.encoding if response.encoding else 'utf-8'
+                content = response.raw.read(_MAX_HTML_BYTES + 1, decode_content=True)
+                if len(content) > _MAX_HTML_BYTES:
+                    logger.warning(f"Body of {url} exceeds {_MAX_HTML_BYTES} bytes, truncating")
+                    content = content[:_MAX_HTML_BYTES]
+                return content, encoding
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed for {url}: {e}")
             return None
+
+    def _fetch_soup(self, url: str, strainer: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetches content from a URL and returns a BeautifulSoup object.
+
+        When a strainer is given, only the matching subtrees are parsed,
+        which cuts parse time and allocation for pages that are just being
+        mined for a few tags.
+        """
+        fetched = self._fetch_html(url)
+        if fetched is None:
+            return None
+        html, encoding = fetched
+        try:
+            # Use the raw body and decode manually for better encoding handling
+            return BeautifulSoup(html, SOUP_PARSER, from_encoding=encoding, parse_only=strainer)
         except Exception as e:
             logger.error(f"Error parsing HTML for {url}: {e}")
             return None
 
+    def _is_duplicate_page_body(self, digest: bytes) -> bool:
+        """Records a page-body fingerprint, reporting whether it was seen before."""
+        if digest in self._seen_page_digests:
+            return True
+        self._seen_page_digests.add(digest)
+        return False
+
+    def _stream_candidate_links(self, url: str) -> Optional[List[str]]:
+        """Harvests candidate links by stream-parsing the response body.
+
+        Feeds iter_content chunks straight into an lxml target parser, so
+        large discovery pages never hold a full body or DOM in memory. A
+        body already sitting in _html_cache (e.g. from API discovery) is fed
+        to the same collector instead of re-fetching the URL. Only used when
+        lxml is installed. Returns resolved absolute URLs, or None on
+        fetch/parse failure.
+        """
+        try:
+            parser = _lxml_etree.HTMLParser(target=_StreamLinkCollector())
+            hasher = hashlib.blake2b(digest_size=16)
+            cached = self._html_cache.pop(url, None)
+            if cached is not None:
+                logger.debug(f"Reusing cached body for {url}")
+                hasher.update(cached[0])
+                parser.feed(cached[0])
+            else:
+                with self.session.get(url, timeout=config.REQUEST_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(16384):
+                        if chunk:
+                            hasher.update(chunk)
+                            parser.feed(chunk)
+            hrefs = parser.close()
+            if self._is_duplicate_page_body(hasher.digest()):
+                logger.debug(f"Duplicate page body at {url}, ignoring its links")
+                return []
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request failed for {url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error stream-parsing HTML for {url}: {e}")
+            return None
+        page_prefix = self._page_prefix(url)
+        return [self._resolve_href(url, page_prefix, href) for href in hrefs
+                if not href.startswith(('#', 'mailto:', 'tel:', 'javascript:'))]
+
     # --- API Discovery ---
 
     def _discover_wp_api(self) -> None:
-        """Tries to find the WP REST API root URL from the base URL."""
+        """Tries to find the WP REST API root URL from the base URL.
+
+        One GET of the base URL answers both checks: its Link header names
+        the API root directly, and its body carries the <link rel> fallback.
+        The body is cached so a subsequent HTML-discovery fetch of the same
+        URL reuses it instead of re-requesting. Discovered roots persist in
+        the on-disk site cache so repeat runs skip the probing entirely.
+        """
         logger.debug(f"Checking for WP REST API at {self.base_url}")
+        # A previous run already discovered this host's API root
+        if not self.refresh_selectors:
+            cached_root = load_api_root(self._base_domain_no_www)
+            if cached_root:
+                self.api_root_url = cached_root
+                logger.info(f"Reusing cached WP REST API endpoint: {cached_root}")
+                return
+
+        # WordPress advertises the API root in the Link header, so a HEAD
+        # answers the happy path without transferring the homepage at all.
         try:
-            response = self.session.head(self.base_url, timeout=config.REQUEST_TIMEOUT, allow_redirects=True)
-            response.raise_for_status()
-            links = response.links
-            if 'https://api.w.org/' in links:
-                self.api_root_url = links['https://api.w.org/']['url']
+            head_response = self.session.head(self.base_url, timeout=config.REQUEST_TIMEOUT,
+                                              allow_redirects=True)
+            if head_response.ok and 'https://api.w.org/' in head_response.links:
+                self.api_root_url = head_response.links['https://api.w.org/']['url']
                 logger.info(f"Discovered WP REST API endpoint: {self.api_root_url}")
+                store_api_root(self._base_domain_no_www, self.api_root_url)
                 return
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"HEAD probe for WP API discovery failed: {e}")
 
-            # Fallback: Check common path
-            potential_api_url = urljoin(self.base_url, '/wp-json/')
-            response = self.session.head(potential_api_url, timeout=config.REQUEST_TIMEOUT)
-            if response.status_code == 200:
-                 self.api_root_url = potential_api_url
-                 logger.info(f"Found potential WP REST API endpoint via common path: {self.api_root_url}")
-                 return
-
+        try:
+            response = self.session.get(self.base_url, timeout=config.REQUEST_TIMEOUT, allow_redirects=True)
+            response.raise_for_status()
         except requests.exceptions.RequestException as e:
-            logger.debug(f"Could not check for WP API via HEAD request: {e}")
+            logger.debug(f"Could not fetch base URL for WP API discovery: {e}")
+            response = None
 
-        # Final check: fetch base URL HTML and look for <link rel="https://api.w.org/">
-        soup = self._fetch_soup(self.base_url)
-        if soup:
-            link_tag = soup.find('link', rel='https://api.w.org/')
-            if link_tag and link_tag.get('href'):
-                self.api_root_url = link_tag['href']
-                logger.info(f"Discovered WP REST API endpoint via <link> tag: {self.api_root_url}")
+        if response is not None:
+            encoding = response.encoding if response.encoding else 'utf-8'
+            self._html_cache[self.base_url] = (response.content, encoding)
 
-        if not self.api_root_url:
-            logger.info("No WP REST API endpoint discovered.")
+            if 'https://api.w.org/' in response.links:
+                self.api_root_url = response.links['https://api.w.org/']['url']
+                logger.info(f"Discovered WP REST API endpoint: {self.api_root_url}")
+                store_api_root(self._base_domain_no_www, self.api_root_url)
+                return
 
-    def _fetch_posts_page_from_api(self, page: int) -> Optional[List[Dict[str, Any]]]:
-        """Fetches a single page of posts from the WP REST API."""
+            # Fallback: look for <link rel="https://api.w.org/"> in the body
+            # we already have. A raw byte scan finds the usual tag shapes
+            # without any HTML parsing; the strained parse only runs when the
+            # regexes come up empty (unusual quoting/markup).
+            for pattern in _WP_API_LINK_RES:
+                match = pattern.search(response.content)
+                if match:
+                    self.api_root_url = match.group(1).decode(encoding, errors='replace')
+                    logger.info(f"Discovered WP REST API endpoint via <link> tag: {self.api_root_url}")
+                    store_api_root(self._base_domain_no_www, self.api_root_url)
+                    return
+            try:
+                soup = BeautifulSoup(response.content, SOUP_PARSER, from_encoding=encoding,
+                                     parse_only=WP_API_LINK_STRAINER)
+                link_tag = soup.find('link', rel='https://api.w.org/')
+                if link_tag and link_tag.get('href'):
+                    self.api_root_url = link_tag['href']
+                    logger.info(f"Discovered WP REST API endpoint via <link> tag: {self.api_root_url}")
+                    store_api_root(self._base_domain_no_www, self.api_root_url)
+                    return
+            except Exception as e:
+                logger.debug(f"Error parsing base URL HTML for WP API link: {e}")
+
+        # Last resort: check the common /wp-json/ path
+        potential_api_url = cached_urljoin(self.base_url, '/wp-json/')
+        try:
+            head_response = self.session.head(potential_api_url, timeout=config.REQUEST_TIMEOUT)
+            if head_response.status_code == 200:
+                self.api_root_url = potential_api_url
+                logger.info(f"Found potential WP REST API endpoint via common path: {self.api_root_url}")
+                store_api_root(self._base_domain_no_www, self.api_root_url)
+                return
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"Could not check for WP API via /wp-json/ probe: {e}")
+
+        logger.info("No WP REST API endpoint discovered.")
+
+    def _request_api_page(self, page: int) -> Optional[requests.Response]:
+        """Issues the GET for a single WP REST API posts page."""
         if not self.api_root_url:
             return None
-        posts_endpoint = urljoin(self.api_root_url, 'wp/v2/posts')
-        params = {'page': page, 'per_page': self.posts_per_page, '_embed': 'true'}
+        posts_endpoint = cached_urljoin(self.api_root_url, 'wp/v2/posts')
+        # Only link/date/title/content are ever read from a post object, so
+        # ask the API for just those; _embed pulled in media and author
+        # blobs that were never used and dominated the payload size.
+        params = {'page': page, 'per_page': self.posts_per_page,
+                  '_fields': 'link,date,title,content'}
         if self.lang:
             params['lang'] = self.lang
 
         try:
             logger.debug(f"Requesting API: {posts_endpoint} with params: {params}")
-            response = self.session.get(posts_endpoint, params=params, timeout=config.REQUEST_TIMEOUT)
+            # Some WP hosts vary their response on Accept; being explicit also
+            # keeps intermediaries from serving a cached HTML variant.
+            response = self.session.get(posts_endpoint, params=params,
+                                        headers={'Accept': 'application/json'},
+                                        timeout=config.REQUEST_TIMEOUT)
             response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            logger.error(f"API request failed: {e}")
+            return None
+
+    @staticmethod
+    def _decode_api_posts(response: requests.Response) -> Optional[List[Dict[str, Any]]]:
+        """Decodes a posts-page response, returning None if it was not JSON."""
+        try:
             # Check if response is actually JSON
             if 'application/json' not in response.headers.get('Content-Type', ''):
                 logger.error("Expected JSON response, but got something else")
                 return None
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
-            return None
+            return _json_loads(response.content)
         except Exception as e:
             logger.error(f"Error processing API response: {e}")
             return None
 
+    def _fetch_posts_page_from_api(self, page: int) -> Optional[List[Dict[str, Any]]]:
+        """Fetches a single page of posts from the WP REST API."""
+        response = self._request_api_page(page)
+        if response is None:
+            return None
+        return self._decode_api_posts(response)
+
     def _fetch_urls_from_api(self) -> bool:
-        """Fetches all post URLs from the WP REST API using pagination."""
+        """Fetches all post URLs from the WP REST API using pagination.
+
+        Pages are requested concurrently in bounded batches; a batch boundary
+        gives a chance to stop early once the API runs out of results.
+        """
         all_posts: List[Dict[str, Any]] = []
-        page = self.start_page
-        max_pages = self.max_pages
         end_page = self.end_page
+        # An empty page range (e.g. --max-pages 0, or an end page below the
+        # start page) means there is nothing to fetch at all.
+        if self.start_page > end_page:
+            logger.info(f"Page range {self.start_page}..{end_page} is empty, skipping API fetch.")
+            return False
+        max_workers = max(1, config.MAX_CONCURRENT_REQUESTS)
 
-        while page <= end_page:
+        def fetch_page(page: int) -> Optional[List[Dict[str, Any]]]:
+            # Be polite between API calls (one schedule shared by all workers)
+            self._pace(config.INTER_REQUEST_DELAY / 2)
             logger.info(f"Fetching API page {page}...")
-            posts = self._fetch_posts_page_from_api(page)
-            if posts:
-                all_posts.extend(posts)
-                # Be polite between API calls
-                time.sleep(config.INTER_REQUEST_DELAY / 2)
-            elif posts == []:
-                logger.info("Reached end of API results.")
-                break
-            else:
-                logger.warning(f"Failed to fetch API page {page}, stopping API fetch.")
-                break
-            page += 1
+            return self._fetch_posts_page_from_api(page)
 
-            if page > end_page:
-                 logger.warning(f"Reached maximum API page limit ({end_page}).")
-                 break
+        # The first response carries X-WP-TotalPages, which lets the rest of
+        # the pages be fetched in one concurrent burst with no end-of-results
+        # probing.
+        logger.info(f"Fetching API page {self.start_page}...")
+        first_response = self._request_api_page(self.start_page)
+        first_posts = self._decode_api_posts(first_response) if first_response is not None else None
+
+        if first_posts:
+            all_posts.extend(first_posts)
+            try:
+                total_pages: Optional[int] = int(first_response.headers['X-WP-TotalPages'])
+            except (KeyError, ValueError):
+                total_pages = None
+
+            if total_pages is not None:
+                last_page = min(end_page, total_pages)
+                remaining = range(self.start_page + 1, last_page + 1)
+                if remaining:
+                    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                        for posts in pool.map(fetch_page, remaining):
+                            if posts:
+                                all_posts.extend(posts)
+                if total_pages > end_page:
+                    logger.warning(f"Reached maximum API page limit ({end_page}).")
+            else:
+                # No total-pages header: probe in concurrent batches and stop
+                # at the first empty or failed page.
+                stopped_early = False
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    for batch_start in range(self.start_page + 1, end_page + 1, max_workers):
+                        batch = range(batch_start, min(batch_start + max_workers, end_page + 1))
+                        for page, posts in zip(batch, pool.map(fetch_page, batch)):
+                            if posts:
+                                all_posts.extend(posts)
+                            elif posts == []:
+                                logger.info("Reached end of API results.")
+                                stopped_early = True
+                                break
+                            else:
+                                logger.warning(f"Failed to fetch API page {page}, stopping API fetch.")
+                                stopped_early = True
+                                break
+                        if stopped_early:
+                            break
+                if not stopped_early and end_page > self.start_page:
+                    logger.warning(f"Reached maximum API page limit ({end_page}).")
+        elif first_posts == []:
+            logger.info("Reached end of API results.")
+        else:
+            logger.warning(f"Failed to fetch API page {self.start_page}, stopping API fetch.")
 
         if not all_posts:
             logger.info("No posts found via the API.")
@@ -250,7 +640,7 @@ class BlogScraper:
             url = post.get('link')
             if url:
                 # Basic validation - is it a valid, absolute URL?
-                parsed = urlparse(url)
+                parsed = cached_urlsplit(url)
                 if parsed.scheme and parsed.netloc:
                     api_urls.add(url)
                     # Store the entire post data keyed by URL for later use
@@ -269,23 +659,21 @@ class BlogScraper:
 
     # --- HTML Discovery & Filtering ---
 
-    def _is_likely_post_url(self, url: str, current_page_url: str) -> bool:
+    def _is_likely_post_url(self, absolute_url: str, parsed_url) -> bool:
         """
-        Heuristically checks if a URL found on `current_page_url` is likely a blog post.
+        Heuristically checks if an already-resolved URL is likely a blog post.
+
+        The caller resolves relative hrefs and parses the result once, so this
+        predicate does no URL parsing of its own.
         """
         try:
-            # Resolve relative URLs relative to the page they were found on
-            absolute_url = urljoin(current_page_url, url)
-            parsed_url = urlparse(absolute_url)
-
             # 1. Must have http/https scheme
             if parsed_url.scheme not in ['http', 'https']:
                 return False
 
-            # 2. Must be on the same *effective* domain (ignore www.)
-            target_domain = parsed_url.netloc.replace('www.', '')
-            base_domain_no_www = self.base_domain.replace('www.', '')
-            if target_domain != base_domain_no_www:
+            # 2. Must be on the same *effective* domain (ignore a leading www.;
+            #    removeprefix avoids mangling domains containing 'www.' elsewhere)
+            if parsed_url.netloc.removeprefix('www.') != self._base_domain_no_www:
                 return False
 
             # 3. Should not be the base URL itself (unless base URL is a single post)
@@ -301,25 +689,32 @@ class BlogScraper:
 
             # 5. Path should generally be longer than the root path found initially
             #    (Handles cases where blog is in subfolder like /blog/)
-            if not parsed_url.path or not parsed_url.path.startswith(self.potential_blog_root):
+            path = parsed_url.path
+            root_is_slash_exception = self._root_is_slash and path != '/'
+            if not path or not path.startswith(self.potential_blog_root):
                  # Allow exceptions if potential_blog_root is just '/'
-                 if not (self.potential_blog_root == '/' and parsed_url.path != '/'):
+                 if not root_is_slash_exception:
                      return False
             # Check path length relative to potential root
-            if len(parsed_url.path) <= len(self.potential_blog_root):
+            if len(path) <= self._root_len:
                  # Allow if potential_blog_root is '/' and path is not just '/'
-                 if not (self.potential_blog_root == '/' and parsed_url.path != '/'):
+                 if not root_is_slash_exception:
                      return False
 
             # 5. Avoid common non-post path segments
-            if any(segment in parsed_url.path for segment in config.NON_POST_PATH_SEGMENTS):
+            if self._nonpost_path_re.search(path):
                 return False
-            # 6. Avoid common non-post query parameters
-            query_params = parse_qs(parsed_url.query)
-            if any(param in query_params for param in config.NON_POST_QUERY_PARAMS):
-                return False
-            # 7. Avoid common file extensions
-            if any(parsed_url.path.lower().endswith(ext) for ext in config.NON_POST_FILE_EXTENSIONS):
+            # 6. Avoid common non-post query parameters. A plain string scan
+            #    of the keys avoids the dict-of-lists parse_qs allocates per link.
+            query = parsed_url.query
+            if query:
+                keys = (pair.split('=', 1)[0] for pair in query.split('&'))
+                if not self._nonpost_query_set.isdisjoint(keys):
+                    return False
+            # 7. Avoid common file extensions. Most paths are already
+            # lowercase, so the islower() fast path skips the allocation.
+            path_lc = path if path.islower() else path.lower()
+            if path_lc.endswith(self._nonpost_ext_tuple):
                 return False
             # 8. Avoid fragments (unless they are the only difference from base_url?) - usually indicates same-page links
             if parsed_url.fragment:
@@ -327,72 +722,82 @@ class BlogScraper:
 
             return True
         except Exception as e:
-            logger.debug(f"Error parsing or validating URL '{url}' relative to '{current_page_url}': {e}")
+            logger.debug(f"Error validating URL '{absolute_url}': {e}")
             return False
 
-    def _extract_article_links(self, soup: BeautifulSoup, page_url: str) -> List[str]:
-        """
-        Extract a set of article-like links using content-based heuristics.
-        This method removes typical navigation sections and applies filters based on link text.
-        """
-        # Remove known navigation sections to reduce noise
-        for container in soup.find_all(['nav', 'header', 'footer']):
-            container.decompose()
+    @staticmethod
+    def _page_prefix(page_url: str) -> str:
+        """Returns the scheme://netloc prefix used to resolve root-relative hrefs."""
+        parsed = cached_urlsplit(page_url)
+        return f"{parsed.scheme}://{parsed.netloc}"
 
-        # Gather links and deduplicate
-        links = set()
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            full_url = urljoin(page_url, href)
-
-            # Skip links that are empty or anchor-only
-            if not full_url or full_url.startswith('#'):
-                continue
+    @staticmethod
+    def _resolve_href(page_url: str, page_prefix: str, href: str) -> str:
+        """Resolves an href against its page.
 
-            # Skip if link text is too short (unless it includes an image with alt text)
-            link_text = a_tag.get_text(strip=True)
-            if len(link_text) < 5 and not (a_tag.find('img') and a_tag.find('img').get('alt')):
-                continue
-
-            # Apply our existing URL-based heuristics
-            if self._is_likely_post_url(href, page_url):
-                links.add(full_url)
-
-        return list(links)
-
-    def _extract_non_wp_article_links(self, soup: BeautifulSoup, page_url: str) -> List[str]:
+        Most hrefs are already absolute or root-relative, which plain string
+        work handles; urljoin only runs for the odd relative path or
+        protocol-relative link.
+        """
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('/') and not href.startswith('//'):
+            return page_prefix + href
+        return cached_urljoin(page_url, href)
+
+    @staticmethod
+    def _tag_text_atleast(tag, n: int) -> bool:
+        """Checks whether a tag's stripped text reaches n characters.
+
+        Walks the tag's strings lazily and bails out as soon as the budget is
+        met, instead of materializing the whole subtree via get_text().
         """
-        Extract a set of article-like links using a generic heuristic that doesn't rely on URL patterns.
-        This is useful for non-WordPress sites where our URL-based heuristics might be too restrictive.
+        total = 0
+        for s in tag.strings:
+            total += len(s.strip())
+            if total >= n:
+                return True
+        return False
 
-        This heuristic:
-        1. Removes typical navigation sections (nav, header, footer)
-        2. Extracts links with substantial text (>5 characters) or with images that have alt text
-        3. Does NOT apply URL-based filtering, making it more suitable for sites with non-standard URL structures
+    def _collect_article_links(self, soup: BeautifulSoup, page_url: str, apply_url_filter: bool = True) -> List[str]:
+        """
+        Extract a set of article-like links using content-based heuristics.
 
-        While this approach may include some non-article links (like social media sharing links),
-        it generally finds more valid article links on non-WordPress sites compared to the WordPress-specific heuristic.
+        Removes typical navigation sections (nav, header, footer) once, then
+        keeps links with substantial text (>5 characters) or images with alt
+        text. With apply_url_filter=True the WordPress-oriented URL
+        heuristics in _is_likely_post_url are applied on top; with False the
+        links are taken as-is, which suits non-WordPress sites whose URL
+        structures the heuristics would reject (at the cost of including
+        some non-article links like social sharing buttons).
         """
         # Remove known navigation sections to reduce noise
         for container in soup.find_all(['nav', 'header', 'footer']):
             container.decompose()
 
+        page_prefix = self._page_prefix(page_url)
+
         # Gather links and deduplicate
         links = set()
         for a_tag in soup.find_all('a', href=True):
             href = a_tag['href']
-            full_url = urljoin(page_url, href)
-
-            # Skip links that are empty or anchor-only
-            if not full_url or full_url.startswith('#'):
+            # Drop anchors and non-HTTP schemes on the raw href, before any
+            # resolution work is spent on them
+            if not href or href.startswith(('#', 'mailto:', 'tel:', 'javascript:')):
                 continue
+            full_url = self._resolve_href(page_url, page_prefix, href)
 
             # Skip if link text is too short (unless it includes an image with alt text)
-            link_text = a_tag.get_text(strip=True)
-            if len(link_text) < 5 and not (a_tag.find('img') and a_tag.find('img').get('alt')):
+            if not self._tag_text_atleast(a_tag, 5):
+                img = a_tag.find('img', alt=True)
+                if img is None or not img['alt']:
+                    continue
+
+            # Apply the URL-based heuristics to the resolved URL, parsing it
+            # exactly once
+            if apply_url_filter and not self._is_likely_post_url(full_url, cached_urlsplit(full_url)):
                 continue
 
-            # Add the link without applying URL-based heuristics
             links.add(full_url)
 
         return list(links)
@@ -406,27 +811,32 @@ class BlogScraper:
             page_url: The URL of the page
             use_wp_heuristics: Whether to use WordPress-specific URL heuristics (default: True)
         """
-        # Choose the appropriate link extraction method based on whether we're dealing with a WordPress site
+        # The URL-based filter only makes sense for WordPress-style sites
         if use_wp_heuristics:
-            article_links = self._extract_article_links(soup, page_url)
             logger.debug("Using WordPress-specific URL heuristics for link discovery")
         else:
-            article_links = self._extract_non_wp_article_links(soup, page_url)
             logger.debug("Using generic heuristics for non-WordPress link discovery")
-
-        # Add new links to discovered_urls
+        article_links = self._collect_article_links(soup, page_url, apply_url_filter=use_wp_heuristics)
+        self._register_new_urls(article_links, page_url)
+
+    def _register_new_urls(self, candidate_urls: List[str], page_url: str) -> None:
+        """Records candidate URLs that have not been seen before."""
+        # Guard the per-link debug log so the f-string is not built at all at
+        # INFO level.
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         found_count = 0
-        for url in article_links:
+        for url in candidate_urls:
             if url not in self.discovered_urls and url not in self.processed_urls:
                 self.discovered_urls.add(url)
                 found_count += 1
-                logger.debug(f"Found potential post link: {url}")
+                if debug_enabled:
+                    logger.debug(f"Found potential post link: {url}")
 
         logger.info(f"Added {found_count} new potential post URLs from {page_url}")
 
-    def _extract_pagination_links(self, soup: BeautifulSoup, page_url: str) -> List[str]:
+    def _extract_pagination_links(self, page_url: str) -> List[str]:
         """
-        Extract pagination links from a page.
+        Extract pagination links derived from a page's URL.
 
         According to requirements, we only want URLs that:
         1. End with "?page=" followed by a number
@@ -434,7 +844,6 @@ class BlogScraper:
         3. Have page numbers between 1 and 100
 
         Args:
-            soup: The BeautifulSoup object of the page
             page_url: The URL of the page
 
         Returns:
@@ -442,29 +851,27 @@ class BlogScraper:
         """
         pagination_links = []
 
-        # Parse the base URL to get the part before any query parameters
-        parsed_url = urlparse(page_url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}"
+        # Find the current page number with one cheap regex probe; crawls
+        # stay on one host, so the ?page= template is cached after the
+        # first call instead of re-parsing every page URL.
+        page_match = _PAGE_PARAM_RE.search(page_url)
+        current_page = int(page_match.group(1)) if page_match else 0
 
-        # Check if the current URL has a page parameter
-        query_params = parse_qs(parsed_url.query)
-        current_page = 0
-        if 'page' in query_params and query_params['page']:
-            try:
-                current_page = int(query_params['page'][0])
-            except ValueError:
-                current_page = 0
+        template = self._pagination_template
+        if template is None:
+            parsed_url = cached_urlsplit(page_url)
+            template = f"{parsed_url.scheme}://{parsed_url.netloc}{parsed_url.path}?page={{}}"
+            self._pagination_template = template
 
         # Generate the next page URL if we're below page 100
         if current_page < 100:
-            next_page = current_page + 1
-            pagination_url = f"{base_url}?page={next_page}"
+            pagination_url = template.format(current_page + 1)
             pagination_links.append(pagination_url)
             logger.debug(f"Generated next pagination URL: {pagination_url}")
 
         # If we're on the base URL (no page parameter), also add page=1
-        if current_page == 0 and 'page' not in query_params:
-            pagination_url = f"{base_url}?page=1"
+        if page_match is None:
+            pagination_url = template.format(1)
             pagination_links.append(pagination_url)
             logger.debug(f"Generated first pagination URL: {pagination_url}")
 
@@ -480,8 +887,11 @@ class BlogScraper:
         """
         logger.info(f"Attempting to find post links via HTML scraping starting from {self.base_url}")
 
-        # Start with the base URL
-        pages_to_scrape = [self.base_url]
+        # Start with the base URL. The frontier is a deque (O(1) pops from
+        # the left) with a companion ever-queued set so membership checks
+        # don't scan the frontier linearly.
+        pages_to_scrape: Deque[str] = deque([self.base_url])
+        queued_pages: Set[str] = {self.base_url}
         scraped_pages = set()
         max_pages = self.max_pages
         start_page = self.start_page
@@ -494,56 +904,92 @@ class BlogScraper:
 
         # Process pages until we run out or hit the limit
         # Skip pages before start_page if possible (for HTML scraping, this is approximate)
-        page_count = 1
-        while pages_to_scrape and page_count <= end_page:
-            current_page_url = pages_to_scrape.pop(0)
-
-            # Skip if we've already scraped this page
-            if current_page_url in scraped_pages:
-                continue
-
-            logger.info(f"Scraping page: {current_page_url}")
-
-            # Store the count of discovered URLs before processing this page
-            # (for detecting if new links were found)
-            initial_discovered_count = len(self.discovered_urls)
-
-            soup = self._fetch_soup(current_page_url)
-            if not soup:
-                logger.warning(f"Could not fetch or parse: {current_page_url}. Skipping.")
-                continue
-
-            # Only find post links if we're at or past the start_page
-            if page_count >= start_page:
-                # Find post links on this page
-                self._find_post_links_on_page(soup, current_page_url, use_wp_heuristics)
-
-                # Calculate how many new links were found on this page
-                new_links_found = len(self.discovered_urls) - initial_discovered_count
-                logger.debug(f"Found {new_links_found} new links on page: {current_page_url}")
+        # Pages are fetched concurrently in waves: everything currently queued
+        # (up to the worker count and the remaining page budget) is dispatched
+        # together, then parsing and pagination enqueueing happen on this
+        # thread so the frontier and discovered sets stay single-threaded.
+        max_workers = max(1, config.MAX_CONCURRENT_REQUESTS)
+        use_streaming = _lxml_etree is not None
+
+        def fetch_page(url: str):
+            # Discovery only needs links: stream-parse them with lxml when
+            # available, otherwise parse a strained soup. Pages whose body
+            # fingerprint was already seen contribute no links.
+            # Be polite between page requests (one schedule shared by all workers)
+            self._pace(config.INTER_REQUEST_DELAY)
+            if use_streaming:
+                result = self._stream_candidate_links(url)
             else:
-                logger.debug(f"Skipping post link discovery for page {page_count} (before start_page {start_page})")
-
-            # Mark this page as scraped
-            scraped_pages.add(current_page_url)
-
-            # Only process the page if we're at or past the start_page
-            if page_count >= start_page:
-                # Find pagination links and add them to the queue
-                pagination_links = self._extract_pagination_links(soup, current_page_url)
-                for link in pagination_links:
-                    if link not in scraped_pages and link not in pages_to_scrape:
-                        pages_to_scrape.append(link)
-                        logger.debug(f"Added pagination link to queue: {link}")
-
-            # Increment page counter
-            page_count += 1
-
-            # We don't need special case handling anymore as we're using a simpler pagination approach
-            # that works for all sites
+                fetched = self._fetch_html(url)
+                if fetched is None:
+                    result = None
+                elif self._is_duplicate_page_body(hashlib.blake2b(fetched[0], digest_size=16).digest()):
+                    logger.debug(f"Duplicate page body at {url}, ignoring its links")
+                    result = []
+                else:
+                    try:
+                        result = BeautifulSoup(fetched[0], SOUP_PARSER, from_encoding=fetched[1], parse_only=LINK_STRAINER)
+                    except Exception as e:
+                        logger.error(f"Error parsing HTML for {url}: {e}")
+                        result = None
+            return result
 
-            # Be polite between page requests
-            time.sleep(config.INTER_REQUEST_DELAY)
+        page_count = 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pages_to_scrape and page_count <= end_page:
+                wave: List[str] = []
+                while pages_to_scrape and len(wave) < max_workers and page_count + len(wave) <= end_page:
+                    candidate = pages_to_scrape.popleft()
+                    if candidate not in scraped_pages and candidate not in wave:
+                        wave.append(candidate)
+                if not wave:
+                    continue
+
+                for current_page_url, result in zip(wave, pool.map(fetch_page, wave)):
+                    logger.info(f"Scraping page: {current_page_url}")
+
+                    # Store the count of discovered URLs before processing this page
+                    # (for detecting if new links were found)
+                    initial_discovered_count = len(self.discovered_urls)
+
+                    if result is None:
+                        logger.warning(f"Could not fetch or parse: {current_page_url}. Skipping.")
+                        continue
+
+                    # Only find post links if we're at or past the start_page
+                    if page_count >= start_page:
+                        # Find post links on this page (streaming and
+                        # duplicate-body results are already candidate lists)
+                        if isinstance(result, list):
+                            candidates = result
+                            if use_wp_heuristics:
+                                candidates = [u for u in candidates
+                                              if self._is_likely_post_url(u, cached_urlsplit(u))]
+                            self._register_new_urls(candidates, current_page_url)
+                        else:
+                            self._find_post_links_on_page(result, current_page_url, use_wp_heuristics)
+
+                        # Calculate how many new links were found on this page
+                        new_links_found = len(self.discovered_urls) - initial_discovered_count
+                        logger.debug(f"Found {new_links_found} new links on page: {current_page_url}")
+                    else:
+                        logger.debug(f"Skipping post link discovery for page {page_count} (before start_page {start_page})")
+
+                    # Mark this page as scraped
+                    scraped_pages.add(current_page_url)
+
+                    # Only process the page if we're at or past the start_page
+                    if page_count >= start_page:
+                        # Find pagination links and add them to the queue
+                        pagination_links = self._extract_pagination_links(current_page_url)
+                        for link in pagination_links:
+                            if link not in scraped_pages and link not in queued_pages:
+                                pages_to_scrape.append(link)
+                                queued_pages.add(link)
+                                logger.debug(f"Added pagination link to queue: {link}")
+
+                    # Increment page counter
+                    page_count += 1
 
         if page_count > end_page:
             logger.warning(f"Reached maximum page limit ({end_page}). Some pages may not have been scraped.")
@@ -553,73 +999,136 @@ class BlogScraper:
 
     # --- Content Extraction ---
 
-    def _guess_content_selectors(self, sample_url: str) -> None:
+    def _guess_content_selectors(self, sample_urls: List[str]) -> None:
         """
         Tries to guess CSS selectors for title, date, and content elements
-        by analyzing the structure of a sample post page.
-        Uses common patterns defined in config.
+        by analyzing the structure of a few sample post pages.
+        Uses common patterns defined in config; when several samples are
+        given, each field goes to the selector most of them agree on, so one
+        atypical page cannot skew the whole run.
         """
-        logger.info(f"Attempting to guess content selectors using sample URL: {sample_url}")
-        soup = self._fetch_soup(sample_url)
-        if not soup:
-            logger.warning("Could not fetch sample URL to guess selectors.")
+        if not sample_urls:
+            return
+
+        # Known platforms get their prebuilt selectors without fetching or
+        # probing any sample page at all.
+        host = cached_urlsplit(sample_urls[0]).netloc.removeprefix('www.')
+        for suffix, selectors in config.KNOWN_HOST_SELECTORS.items():
+            if host == suffix or host.endswith('.' + suffix):
+                self.content_selectors.update(selectors)
+                logger.info(f"Using known selectors for {suffix} host: {host}")
+                return
+
+        # A previous run on this host already paid for the probe
+        if not self.refresh_selectors:
+            cached = load_selectors(host)
+            if cached:
+                self.content_selectors.update(cached)
+                logger.info(f"Reusing cached content selectors for {host}")
+                return
+
+        logger.info(f"Attempting to guess content selectors using {len(sample_urls)} sample URL(s)")
+        with ThreadPoolExecutor(max_workers=len(sample_urls)) as pool:
+            fetched = list(pool.map(self._fetch_html, sample_urls))
+
+        title_votes: Counter = Counter()
+        date_votes: Counter = Counter()
+        content_votes: Counter = Counter()
+        for sample_url, body in zip(sample_urls, fetched):
+            if body is None:
+                continue
+            # The sample bodies double as the first extraction fetches
+            self._html_cache[sample_url] = body
+            try:
+                soup = BeautifulSoup(body[0], SOUP_PARSER, from_encoding=body[1])
+            except Exception as e:
+                logger.error(f"Error parsing sample HTML for {sample_url}: {e}")
+                continue
+            probed = self._probe_selectors(soup)
+            if probed['title']:
+                title_votes[probed['title']] += 1
+            if probed['date']:
+                date_votes[(probed['date'], probed['date_attr'])] += 1
+            if probed['content']:
+                content_votes[probed['content']] += 1
+
+        if not (title_votes or date_votes or content_votes):
+            logger.warning("Could not fetch any sample URL to guess selectors.")
             return
 
+        if title_votes:
+            self.content_selectors['title'] = title_votes.most_common(1)[0][0]
+        if date_votes:
+            date_sel, date_attr = date_votes.most_common(1)[0][0]
+            self.content_selectors['date'] = date_sel
+            self.content_selectors['date_attr'] = date_attr
+        if content_votes:
+            self.content_selectors['content'] = content_votes.most_common(1)[0][0]
+        logger.debug(f"Guessed selectors by vote: {self.content_selectors}")
+
+        if not title_votes or not content_votes:
+            logger.warning("Incomplete content selectors guessed")
+        else:
+            store_selectors(host, self.content_selectors)
+
+    def _probe_selectors(self, soup: BeautifulSoup) -> Dict[str, Optional[str]]:
+        """Runs the selector heuristics against one sample page's soup."""
+        probed: Dict[str, Optional[str]] = {'title': None, 'date': None,
+                                            'date_attr': None, 'content': None}
+
         # 1. Guess Title Selector
-        found_title = False
         title_selectors = config.COMMON_TITLE_SELECTORS + ['h1']
         for selector in title_selectors:
-            element = soup.select_one(selector)
-            if element and len(element.get_text(strip=True)) > 3:
-                self.content_selectors['title'] = selector
-                found_title = True
+            element = _compiled_selector(selector).select_one(soup)
+            if element and self._tag_text_atleast(element, 4):
+                probed['title'] = selector
                 logger.debug(f"Guessed title selector: {selector}")
                 break
 
         # 2. Guess Date Selector (prioritize <time> tags)
-        found_date = False
         date_selectors = config.COMMON_DATE_SELECTORS
         for selector in date_selectors:
-            element = soup.select_one(selector)
+            element = _compiled_selector(selector).select_one(soup)
             if element:
                 if element.name == 'time' and element.has_attr('datetime'):
-                    self.content_selectors['date'] = selector
-                    self.content_selectors['date_attr'] = 'datetime'
-                    found_date = True
+                    probed['date'] = selector
+                    probed['date_attr'] = 'datetime'
                     break
 
         # If no <time datetime> found, check again for any date selector match just for text
-        if not found_date:
+        if not probed['date']:
             for selector in date_selectors:
-                 element = soup.select_one(selector)
-                 if element and len(element.get_text(strip=True)) > 4:
-                     self.content_selectors['date'] = selector
-                     self.content_selectors['date_attr'] = None
-                     found_date = True
+                 element = _compiled_selector(selector).select_one(soup)
+                 if element and self._tag_text_atleast(element, 5):
+                     probed['date'] = selector
                      break
 
-        if found_date and self.content_selectors['date']:
-             logger.debug(f"Guessed date selector: {self.content_selectors['date']} (Attribute: {self.content_selectors['date_attr']})")
+        if probed['date']:
+             logger.debug(f"Guessed date selector: {probed['date']} (Attribute: {probed['date_attr']})")
 
         # 3. Guess Content Selector
-        found_content = False
         content_selectors = config.COMMON_CONTENT_SELECTORS + ['article', 'main']
         for selector in content_selectors:
-            element = soup.select_one(selector)
-            # Basic validation: Element exists and has substantial text content
-            if element and len(element.get_text(strip=True)) > config.MIN_CONTENT_LENGTH:
-                self.content_selectors['content'] = selector
-                found_content = True
+            element = _compiled_selector(selector).select_one(soup)
+            # Basic validation: Element exists and has substantial text
+            # content; the early-exit walk stops as soon as the length
+            # threshold is met instead of materializing the whole body text.
+            if element and self._tag_text_atleast(element, config.MIN_CONTENT_LENGTH + 1):
+                probed['content'] = selector
                 logger.debug(f"Guessed content selector: {selector}")
                 break
 
-        if not found_title or not found_content:
-            logger.warning("Incomplete content selectors guessed")
+        return probed
 
-    def _extract_post_data(self, url: str, soup: BeautifulSoup, api_data: Optional[Dict[str, Any]] = None) -> Optional[PostData]:
+    @staticmethod
+    def _extract_post_fields(url: str, soup: BeautifulSoup, content_selectors: Dict[str, Optional[str]],
+                             api_data: Optional[Dict[str, Any]] = None) -> Optional[PostData]:
         """
         Extracts title, date, and content from a post's soup using guessed selectors.
         If api_data is provided, uses it for metadata like dates.
+
+        Static (no scraper state beyond the selector dict) so it can run in a
+        worker process.
         """
         title, date_str, content = None, None, None
 
@@ -630,7 +1139,7 @@ class BlogScraper:
                 title = api_data['title']['rendered']
                 if title:
                     # Remove HTML tags if present
-                    title = re.sub(r'<[^>]+>', '', title).strip()
+                    title = _HTML_TAG_RE.sub('', title).strip()
                     logger.debug(f"Using title from API: {title[:50]}...")
 
             # Extract date from API data
@@ -639,8 +1148,8 @@ class BlogScraper:
                 logger.debug(f"Using date from API: {date_str}")
 
         # If title not found in API data, extract from HTML
-        if not title and self.content_selectors['title']:
-            element = soup.select_one(self.content_selectors['title'])
+        if not title and content_selectors['title']:
+            element = _compiled_selector(content_selectors['title']).select_one(soup)
             if element:
                 title = element.get_text(strip=True)
 
@@ -659,35 +1168,26 @@ class BlogScraper:
                         break
 
         # If date not found in API data, extract from HTML
-        if not date_str and self.content_selectors['date']:
-            element = soup.select_one(self.content_selectors['date'])
+        if not date_str and content_selectors['date']:
+            element = _compiled_selector(content_selectors['date']).select_one(soup)
             if element:
-                attr = self.content_selectors['date_attr']
+                attr = content_selectors['date_attr']
                 if attr and element.has_attr(attr):
                     date_str = element[attr]
                 else: # Get text if attribute not specified or not found
                     date_str = element.get_text(strip=True)
-        elif not date_str and self.content_selectors['date_text']: # Use regex match if available
-             date_str = self.content_selectors['date_text']
+        elif not date_str and content_selectors['date_text']: # Use regex match if available
+             date_str = content_selectors['date_text']
 
         # Fallback: Look for any date in the content
         if not date_str and content:
             # Look for common date formats in the content
             # This will match dates like DD.MM.YYYY, YYYY-MM-DD, MM/DD/YYYY, etc.
             # It will also match dates with a "Blog" prefix or any other prefix
-            date_patterns = [
-                r'(\d{1,2}\.\d{1,2}\.\d{4})',  # DD.MM.YYYY
-                r'(\d{4}-\d{1,2}-\d{1,2})',    # YYYY-MM-DD
-                r'(\d{1,2}/\d{1,2}/\d{4})',    # MM/DD/YYYY or DD/MM/YYYY
-                r'(\d{1,2}\s+[A-Za-z]+\s+\d{4})'  # DD Month YYYY
-            ]
-
-            for pattern in date_patterns:
-                date_match = re.search(pattern, content)
-                if date_match:
-                    date_str = date_match.group(1)
-                    logger.debug(f"Extracted date from content: {date_str}")
-                    break
+            date_match = _CONTENT_DATE_RE.search(content)
+            if date_match:
+                date_str = date_match.group(1)
+                logger.debug(f"Extracted date from content: {date_str}")
 
         # Try to extract content from API data if available
         if api_data and 'content' in api_data and 'rendered' in api_data['content']:
@@ -695,20 +1195,23 @@ class BlogScraper:
             api_content = api_data['content']['rendered']
             if api_content:
                 # Convert HTML to plain text
-                soup_content = BeautifulSoup(api_content, 'html.parser')
+                soup_content = BeautifulSoup(api_content, SOUP_PARSER)
                 content = soup_content.get_text(separator='\n')
                 logger.debug(f"Using content from API, length: {len(content)}")
                 content_extracted = True
         else:
             # Extract Content from HTML
             content_extracted = False
-            if self.content_selectors['content']:
-                element = soup.select_one(self.content_selectors['content'])
+            if content_selectors['content']:
+                element = _compiled_selector(content_selectors['content']).select_one(soup)
                 if element:
-                    # Basic cleanup - get text, separate paragraphs
-                    paragraphs = element.find_all(['p', 'h1', 'h2', 'h3', 'h4', 'li', 'pre']) # Common text block tags
+                    # Basic cleanup - get text, separate paragraphs. A
+                    # compiled selector does the tag-set matching in one
+                    # cached-pattern pass instead of find_all's per-node
+                    # Python list membership test.
+                    paragraphs = _compiled_selector('p, h1, h2, h3, h4, li, pre').select(element) # Common text block tags
                     if paragraphs:
-                         content = "\n".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+                         content = "\n".join(text for p in paragraphs if (text := p.get_text(strip=True)))
                          content_extracted = bool(content)
 
                     # Fallback to all text if no block tags found or no content extracted
@@ -722,9 +1225,9 @@ class BlogScraper:
                 main_tag = soup.find('main')
                 if main_tag:
                     # Try to find paragraphs within main
-                    paragraphs = main_tag.find_all(['p', 'h2', 'h3', 'h4', 'li', 'pre'])
+                    paragraphs = _compiled_selector('p, h2, h3, h4, li, pre').select(main_tag)
                     if paragraphs:
-                        content = "\n".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+                        content = "\n".join(text for p in paragraphs if (text := p.get_text(strip=True)))
                         content_extracted = bool(content)
 
                     # If still no content, try to get all text from main
@@ -739,9 +1242,9 @@ class BlogScraper:
                 if not content_extracted:
                     article_tags = soup.find_all('article')
                     for article in article_tags:
-                        paragraphs = article.find_all(['p', 'h2', 'h3', 'h4', 'li', 'pre'])
+                        paragraphs = _compiled_selector('p, h2, h3, h4, li, pre').select(article)
                         if paragraphs:
-                            content = "\n".join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
+                            content = "\n".join(text for p in paragraphs if (text := p.get_text(strip=True)))
                             content_extracted = bool(content)
                             if content_extracted:
                                 logger.debug(f"Extracted content from article tag, length: {len(content)}")
@@ -752,7 +1255,7 @@ class BlogScraper:
             # Post-process content to remove excessive consecutive empty lines
             if content:
                 # Replace 3 or more consecutive newlines with 2 newlines (one empty line)
-                content = re.sub(r'\n{3,}', '\n\n', content)
+                content = _EXCESS_NEWLINES_RE.sub('\n\n', content)
 
             logger.debug(f"Extracted - Title: {title is not None}, Date: {date_str is not None}, Content: {content is not None} from {url}")
             return PostData(url=url, title=title, date=date_str, content=content)
@@ -760,6 +1263,22 @@ class BlogScraper:
             logger.warning(f"Could not extract sufficient data (title/content) from {url} using guessed selectors.")
             return None
 
+    @staticmethod
+    def _extract_post_worker(url: str, html: bytes, encoding: str, content_selectors: Dict[str, Optional[str]],
+                             api_data: Optional[Dict[str, Any]]) -> Tuple[Optional[PostData], bool]:
+        """Parses fetched HTML and extracts a post; runs in a worker process.
+
+        Returns (post, parse_failed); the flag distinguishes a body that
+        would not parse at all (the caller can still fall back to API
+        metadata) from a page that parsed but yielded no extractable post.
+        """
+        try:
+            soup = BeautifulSoup(html, SOUP_PARSER, from_encoding=encoding)
+        except Exception as e:
+            logger.error(f"Error parsing HTML for {url}: {e}")
+            return None, True
+        return BlogScraper._extract_post_fields(url, soup, content_selectors, api_data), False
+
     def _analyze_url_patterns(self) -> None:
         """
         Analyzes discovered URLs to identify the most likely blog post URL pattern.
@@ -769,54 +1288,46 @@ class BlogScraper:
             logger.warning("No URLs to analyze for patterns.")
             return
 
-        # Extract path patterns from URLs
-        path_patterns = {}
+        # Compute each URL's path pattern (the directory structure with the
+        # last segment wildcarded) in a single pass, keeping the (url,
+        # pattern) pairs so the filtering step below does not re-split
+        # anything; Counter.most_common avoids a second walk to find the max.
+        url_patterns: List[Tuple[str, str]] = []
         for url in self.discovered_urls:
-            parsed = urlparse(url)
-            path = parsed.path
+            parsed = cached_urlsplit(url)
 
             # Skip URLs with query parameters or fragments for pattern analysis
             if parsed.query or parsed.fragment:
                 continue
 
-            # Count occurrences of each path pattern
-            # We'll look at the directory structure and count how many URLs share similar patterns
-            path_parts = path.split('/')
-            if len(path_parts) >= 3:  # Need at least /dir/something
-                # Create a pattern by keeping the directory structure but replacing the last part with a wildcard
-                pattern = '/'.join(path_parts[:-1]) + '/*'
-                path_patterns[pattern] = path_patterns.get(pattern, 0) + 1
-
-        # Find the most common pattern
-        most_common_pattern = None
-        max_count = 0
-        for pattern, count in path_patterns.items():
-            if count > max_count:
-                max_count = count
-                most_common_pattern = pattern
+            # Need at least /dir/something; slicing at the last slash gives
+            # the same wildcarded pattern as split/join without building a
+            # list per URL.
+            path = parsed.path
+            if path.count('/') >= 2:
+                url_patterns.append((url, path[:path.rfind('/')] + '/*'))
+
+        pattern_counter = Counter(pattern for _, pattern in url_patterns)
+        if pattern_counter:
+            most_common_pattern, max_count = pattern_counter.most_common(1)[0]
+        else:
+            most_common_pattern, max_count = None, 0
 
         if most_common_pattern and max_count >= 3:  # Require at least 3 URLs with the same pattern
             self.likely_post_url_pattern = most_common_pattern
             logger.info(f"Identified likely blog post URL pattern: {most_common_pattern} (matched {max_count} URLs)")
 
             # Filter URLs based on the identified pattern
-            for url in self.discovered_urls:
-                parsed = urlparse(url)
-                path = parsed.path
-                path_parts = path.split('/')
-                if len(path_parts) >= 3:
-                    # Check if this URL matches the pattern (same directory structure)
-                    url_pattern = '/'.join(path_parts[:-1]) + '/*'
-                    if url_pattern == self.likely_post_url_pattern:
-                        self.filtered_urls.add(url)
+            self.filtered_urls.update(
+                url for url, pattern in url_patterns if pattern == most_common_pattern)
 
             logger.info(f"Filtered {len(self.filtered_urls)} URLs that match the likely blog post pattern out of {len(self.discovered_urls)} total discovered URLs")
         else:
             logger.warning("Could not identify a clear blog post URL pattern. Using all discovered URLs.")
             self.filtered_urls = self.discovered_urls.copy()
 
-    def _fetch_and_extract_posts(self) -> None:
-        """Iterates through discovered URLs, fetches content, and extracts data."""
+    def _fetch_and_extract_posts(self) -> Iterator[PostData]:
+        """Iterates through discovered URLs, fetching content and yielding extracted posts."""
         if not self.discovered_urls:
              logger.warning("No potential post URLs were discovered. Cannot extract posts.")
              return
@@ -829,44 +1340,107 @@ class BlogScraper:
 
         # Use the first URL to guess selectors if not already done (e.g., by API)
         if not self._api_used_successfully and not any(self.content_selectors.values()) and urls_to_process:
-            sample_url = next(iter(urls_to_process)) # Get an arbitrary URL from the set
-            self._guess_content_selectors(sample_url)
+            # Probe a few samples so one atypical page cannot skew the run
+            sample_urls = [url for _, url in zip(range(3), urls_to_process)]
+            self._guess_content_selectors(sample_urls)
 
         logger.info(f"Fetching content for {len(urls_to_process)} URLs...")
-        for url in list(urls_to_process): # Iterate over a copy for safe removal
-            if url in self.processed_urls:
-                continue
+        pending_urls = [url for url in urls_to_process if url not in self.processed_urls]
+
+        # Fetch pages on worker threads (the work is I/O bound) and hand the
+        # CPU-bound parse+extract step to worker processes so bs4 parsing is
+        # not serialized behind the GIL. A bounded window of in-flight parses
+        # keeps results ordered and memory capped. Fetch workers take slots
+        # from the shared pacer, keeping the aggregate request rate at the
+        # serial politeness delay.
+        max_workers = max(1, config.MAX_CONCURRENT_REQUESTS)
+        parse_workers = max(1, os.cpu_count() or 1)
+
+        def paced_fetch(url: str) -> Optional[Tuple[bytes, str]]:
+            self._pace(config.INTER_REQUEST_DELAY)
+            return self._fetch_html(url)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as fetch_pool, \
+                ProcessPoolExecutor(max_workers=parse_workers) as parse_pool:
+            in_flight: Deque[Tuple[str, Optional[Future]]] = deque()
+
+            def drain_one() -> Optional[PostData]:
+                done_url, done_future = in_flight.popleft()
+                if done_future is None:
+                    return self._finalize_post(done_url, None, html_failed=True)
+                extracted, parse_failed = done_future.result()
+                return self._finalize_post(done_url, extracted, html_failed=parse_failed)
+
+            # Submit fetches through a bounded window too: Executor.map would
+            # queue every URL up front, letting completed bodies pile up
+            # unbounded whenever parsing or writing lags the network. Capping
+            # outstanding fetches bounds the buffered bodies while still
+            # keeping every fetch worker busy.
+            fetch_queue: Deque[Tuple[str, Future]] = deque()
+            url_iter = iter(pending_urls)
+
+            def top_up_fetches() -> None:
+                while len(fetch_queue) < max_workers * 2:
+                    next_url = next(url_iter, None)
+                    if next_url is None:
+                        return
+                    fetch_queue.append((next_url, fetch_pool.submit(paced_fetch, next_url)))
+
+            top_up_fetches()
+            while fetch_queue:
+                url, fetch_future = fetch_queue.popleft()
+                fetched = fetch_future.result()
+                top_up_fetches()
+                logger.info(f"Processing URL: {url}")
+                if fetched is None:
+                    in_flight.append((url, None))
+                else:
+                    html, encoding = fetched
+                    future = parse_pool.submit(
+                        BlogScraper._extract_post_worker, url, html, encoding,
+                        dict(self.content_selectors), self.api_post_data.get(url))
+                    in_flight.append((url, future))
+
+                while len(in_flight) > parse_workers:
+                    post_data = drain_one()
+                    if post_data:
+                        yield post_data
+
+            while in_flight:
+                post_data = drain_one()
+                if post_data:
+                    yield post_data
 
-            logger.info(f"Processing URL: {url}")
+    def _finalize_post(self, url: str, post_data: Optional[PostData], html_failed: bool) -> Optional[PostData]:
+        """Saves an extracted post and records its URL as processed.
 
-            # Check if we have API data for this URL
+        Falls back to API metadata when the HTML could not be fetched or
+        parsed. Returns the PostData that was saved, or None.
+        """
+        if post_data is None and html_failed:
             api_data = self.api_post_data.get(url)
-
-            # Fetch HTML content
-            soup = self._fetch_soup(url)
-            if soup:
-                # Extract post data from HTML, potentially using API data for metadata
-                post_data = self._extract_post_data(url, soup, api_data)
-                if post_data:
-                    self.all_post_data.append(post_data)
-                    # Save post immediately after processing
-                    self._save_post_to_file(post_data, len(self.all_post_data) - 1)
+            if api_data:
+                # If HTML fetch/parse failed but we have API data, create PostData from API data only
+                logger.info(f"Using API data for {url} as HTML fetch/parse failed")
+                title = api_data.get('title', {}).get('rendered', '')
+                date = api_data.get('date', '')
+                # We don't have content, but at least we have title and date
+                post_data = PostData(url=url, title=title, date=date, content=None)
             else:
-                # If HTML fetch failed but we have API data, create PostData from API data only
-                if api_data:
-                    logger.info(f"Using API data for {url} as HTML fetch failed")
-                    title = api_data.get('title', {}).get('rendered', '')
-                    date = api_data.get('date', '')
-                    # We don't have content, but at least we have title and date
-                    post_data = PostData(url=url, title=title, date=date, content=None)
-                    self.all_post_data.append(post_data)
-                    self._save_post_to_file(post_data, len(self.all_post_data) - 1)
-                else:
-                    logger.warning(f"Skipping post data extraction for {url} due to fetch/parse error.")
+                logger.warning(f"Skipping post data extraction for {url} due to fetch/parse error.")
+
+        if post_data:
+            # Save immediately, but hand the disk write to a dedicated writer
+            # thread so extraction does not stall on file I/O. A single worker
+            # keeps writes ordered.
+            if self._write_executor is None:
+                self._write_executor = ThreadPoolExecutor(max_workers=1)
+            future = self._write_executor.submit(self._save_post_to_file, post_data, self._saved_post_count)
+            future.add_done_callback(self._log_write_failure)
+            self._saved_post_count += 1
 
-            self.processed_urls.add(url)
-            # Be polite between fetching full post pages
-            time.sleep(config.INTER_REQUEST_DELAY)
+        self.processed_urls.add(url)
+        return post_data
 
     def run(self) -> List[PostData]:
         """
@@ -884,15 +1458,64 @@ class BlogScraper:
         Returns:
             A list of PostData objects containing the extracted blog posts
         """
-        self._discover_wp_api()
-        if self.api_root_url:
-            self._fetch_urls_from_api() # Populates self.discovered_urls if successful
+        for post_data in self.iter_posts():
+            self.all_post_data.append(post_data)
+
+        return self.all_post_data
+
+    def iter_posts(self) -> Iterator[PostData]:
+        """Runs the scraping process, yielding each post as it is extracted.
+
+        Unlike run(), this does not accumulate posts in memory, so callers
+        that only need to stream posts (e.g., straight to disk) stay bounded
+        at one post at a time.
+        """
+        try:
+            self._discover_wp_api()
+            if self.api_root_url:
+                self._fetch_urls_from_api() # Populates self.discovered_urls if successful
+
+            if not self._api_used_successfully:
+                logger.info("API not found or failed, falling back to HTML link discovery.")
+                # Use generic heuristic for non-WordPress sites
+                self._scrape_html_for_links(use_wp_heuristics=False) # Adds to self.discovered_urls
+
+            yield from self._fetch_and_extract_posts() # Fetches content and extracts data
+        except BaseException:
+            self.close(success=False)
+            raise
+        else:
+            self.close()
 
-        if not self._api_used_successfully:
-            logger.info("API not found or failed, falling back to HTML link discovery.")
-            # Use generic heuristic for non-WordPress sites
-            self._scrape_html_for_links(use_wp_heuristics=False) # Adds to self.discovered_urls
+    @staticmethod
+    def _log_write_failure(future) -> None:
+        """Reports exceptions raised by background file writes."""
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Failed to save post to file: {exc}")
 
-        self._fetch_and_extract_posts() # Fetches content and extracts data
+    def close(self, success: bool = True) -> None:
+        """Drains pending writes and finishes the single-file output, if opened.
 
-        return self.all_post_data 
+        On success the temp file is atomically moved over the real output
+        path; otherwise it is discarded, leaving any previous output intact.
+        """
+        if self._write_executor is not None:
+            self._write_executor.shutdown(wait=True)
+            self._write_executor = None
+        if self._one_file_fd is not None:
+            if self._one_file_buf:
+                os.write(self._one_file_fd, self._one_file_buf)
+                self._one_file_buf.clear()
+            os.close(self._one_file_fd)
+            self._one_file_fd = None
+            if success:
+                os.replace(self._one_file_tmp, self.output_filename)
+            else:
+                try:
+                    os.remove(self._one_file_tmp)
+                except OSError:
+                    pass
+            self._one_file_tmp = None
+        # Return the keep-alive sockets held by the connection pool
+        self.session.close()